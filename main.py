@@ -10,17 +10,27 @@ simplicity—no external database is required. Use this as a starting
 point for a more robust, database‑backed solution.
 """
 
-from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import RedirectResponse
-from fastapi.staticfiles import StaticFiles
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import InitVar, dataclass, field
 from pathlib import Path
-from typing import List, Dict, Optional
-# Note: SessionMiddleware is commented out because itsdangerous is not installed
-# from starlette.middleware.sessions import SessionMiddleware
-from fastapi.templating import Jinja2Templates
+from typing import Iterator, List, Dict, Optional, Tuple
+
+from fastapi import Cookie, Depends, FastAPI, Form, Query, Request, HTTPException
+from fastapi.responses import HTMLResponse, ORJSONResponse, RedirectResponse, Response
+from fastapi.staticfiles import StaticFiles
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 
-app = FastAPI(title="ReadyBuddy")
+logger = logging.getLogger(__name__)
 
 # Define base directories up front so they can be used throughout the module.  We
 # calculate BASE_DIR relative to this file, and then derive the template
@@ -36,12 +46,56 @@ STATIC_DIR = BASE_DIR / "static"
 # avoids any external dependencies and works well on free hosting tiers. The
 # database stores user profiles created via the onboarding form and quiz results
 # for each module. When the server starts, we ensure the tables exist.
-import sqlite3
 
-# Database file is stored alongside the application code. Using .as_posix() ensures
-# SQLite receives a string path. The database will persist between requests
-# within the same server instance.
-DB_PATH = (BASE_DIR / "app.db").as_posix()
+# Database file is stored alongside the application code. sqlite3 accepts a
+# Path directly; it is only used when connections are opened at startup, never
+# on the request path. The database will persist between requests within the
+# same server instance.
+DB_PATH: Path = BASE_DIR / "app.db"
+
+
+# PRAGMAs applied to every connection, sent as one script rather than one
+# statement each. Python's sqlite3 module doesn't understand the `_journal_mode`
+# style URI parameters some other drivers accept, so the URI only carries the
+# open mode.
+CONN_PRAGMAS = """
+PRAGMA busy_timeout=5000;
+PRAGMA cache_size=-20000;
+PRAGMA temp_store=memory;
+PRAGMA foreign_keys=ON;
+"""
+# Additional PRAGMAs for the writer. journal_mode is persistent, so readers
+# inherit WAL from the database file.
+WRITER_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+"""
+
+
+def get_conn(read_only: bool = False) -> sqlite3.Connection:
+    """
+    Open a SQLite connection for the shared writer or the read pool. The
+    connection runs in autocommit mode (`isolation_level=None`) and may be
+    used from any thread. The writer switches the database to write‑ahead
+    logging and relaxes fsyncs to the level WAL considers safe; every
+    connection waits on locks instead of failing immediately and gets a
+    larger page cache. Read‑only connections are opened with `mode=ro`, so
+    they can never take the write lock.
+    """
+    mode = "ro" if read_only else "rwc"
+    conn = sqlite3.connect(
+        f"{DB_PATH.as_uri()}?mode={mode}", uri=True, check_same_thread=False, isolation_level=None
+    )
+    conn.executescript(CONN_PRAGMAS if read_only else WRITER_PRAGMAS + CONN_PRAGMAS)
+    return conn
+
+
+# A single writer connection is opened when the module is imported and reused
+# by all request handlers, rather than paying for a fresh connect/close on
+# every write. SQLite allows only one writer at a time, so writes are
+# serialized through DB_LOCK. Reads go through the separate pool below.
+DB = get_conn()
+DB_LOCK = threading.Lock()
 
 
 def init_db() -> None:
@@ -50,8 +104,7 @@ def init_db() -> None:
     quiz results do not exist, create them. This function is idempotent and
     will not overwrite existing data.
     """
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
+    cur = DB.cursor()
     # Table for storing onboarding responses. Each user is assigned a unique
     # integer primary key. We store the number of household members, the
     # location string, and the self‑assessed skill level.
@@ -80,8 +133,51 @@ def init_db() -> None:
         )
         """
     )
-    conn.commit()
-    conn.close()
+    # Indexes for per‑user progress queries ("best score per module",
+    # "most recent results"), so they don't have to scan every quiz result.
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_quiz_user_module ON quiz_results(user_id, module_id)"
+    )
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_quiz_user_ts ON quiz_results(user_id, timestamp DESC)"
+    )
+
+
+def _write_profile(family_size: int, location: str, skill_level: str) -> Optional[int]:
+    """
+    Insert an onboarding profile and return its new row ID. This is a plain
+    synchronous function so request handlers can run it in a worker thread
+    instead of blocking the event loop on disk I/O.
+    """
+    with DB_LOCK:
+        cur = DB.execute(
+            "INSERT INTO user_profiles (family_size, location, skill_level) VALUES (?, ?, ?)",
+            (family_size, location, skill_level),
+        )
+        return cur.lastrowid
+
+
+def _write_quiz_results(batch: List[Tuple[int, int, int]]) -> None:
+    """
+    Insert a batch of (user_id, module_id, score) quiz results in a single
+    transaction, so a burst of submissions costs one commit instead of one
+    per row. Like `_write_profile`, this runs off the event loop. Results
+    whose user_id has no profile (a forged cookie, or one left over from a
+    wiped database) are skipped in SQL rather than failing the foreign key
+    and taking the rest of the batch down with them.
+    """
+    with DB_LOCK:
+        DB.execute("BEGIN IMMEDIATE")
+        try:
+            DB.executemany(
+                "INSERT INTO quiz_results (user_id, module_id, score) "
+                "SELECT ?, ?, ? WHERE EXISTS (SELECT 1 FROM user_profiles WHERE id = ?)",
+                [(user_id, module_id, score, user_id) for user_id, module_id, score in batch],
+            )
+        except Exception:
+            DB.execute("ROLLBACK")
+            raise
+        DB.execute("COMMIT")
 
 
 # Ensure the database is ready when the module is imported. If you're running
@@ -89,22 +185,147 @@ def init_db() -> None:
 # will persist across requests as long as the instance remains active.
 init_db()
 
-# Add session middleware to enable per‑user storage of onboarding info
-# SessionMiddleware would normally allow us to persist onboarding data per user,
-# but it's commented out here because the itsdangerous dependency isn't
-# available in this environment. You can re‑enable it after installing
-# itsdangerous by uncommenting the import and the line below.
-# app.add_middleware(SessionMiddleware, secret_key="change_this_secret_key")
+# Pool of read‑only connections, one per CPU. With the database in WAL mode,
+# readers see a consistent snapshot and neither block nor are blocked by the
+# writer. Use `with acquire_read() as conn:` to borrow one.
+READ_POOL_SIZE = os.cpu_count() or 1
+_read_pool: queue.Queue[sqlite3.Connection] = queue.Queue()
+for _ in range(READ_POOL_SIZE):
+    _read_pool.put(get_conn(read_only=True))
+
+
+@contextmanager
+def acquire_read() -> Iterator[sqlite3.Connection]:
+    """Borrow a read‑only connection from the pool, waiting if all are in use."""
+    conn = _read_pool.get()
+    try:
+        yield conn
+    finally:
+        _read_pool.put(conn)
+
+
+# Quiz submissions are queued in memory and written by a background task
+# rather than inserted by the request handler. The flusher waits up to
+# QUIZ_FLUSH_INTERVAL_MS after the first queued result so that results
+# arriving together (e.g. a classroom finishing a module at once) are
+# committed in one batch of at most QUIZ_FLUSH_BATCH_SIZE rows. An asyncio
+# queue is tied to the event loop that first waits on it, so lifespan creates
+# a fresh one each time the app starts.
+QUIZ_FLUSH_BATCH_SIZE = 500
+QUIZ_FLUSH_INTERVAL_MS = 50
+_quiz_queue: asyncio.Queue[Tuple[int, int, int]] = asyncio.Queue()
+
+
+def _drain_quiz_queue(batch: List[Tuple[int, int, int]]) -> None:
+    """Move queued quiz results into `batch` without waiting, up to the batch size."""
+    while len(batch) < QUIZ_FLUSH_BATCH_SIZE and not _quiz_queue.empty():
+        batch.append(_quiz_queue.get_nowait())
+
+
+async def _flush_quiz_results() -> None:
+    """Background task that writes queued quiz results in batches."""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await _quiz_queue.get()]
+        try:
+            await asyncio.sleep(QUIZ_FLUSH_INTERVAL_MS / 1000)
+        except asyncio.CancelledError:
+            # Shutting down: hand the result back so lifespan writes it.
+            _quiz_queue.put_nowait(batch[0])
+            raise
+        _drain_quiz_queue(batch)
+        try:
+            await loop.run_in_executor(None, _write_quiz_results, batch)
+        except Exception:
+            # Log and drop this batch; the flusher keeps serving later ones.
+            logger.exception("Failed to write %d quiz results", len(batch))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Start the quiz result flusher when the server starts. On shutdown the
+    flusher is stopped and anything still queued is written before exit.
+    """
+    global _quiz_queue
+    _quiz_queue = asyncio.Queue()
+    flusher = asyncio.create_task(_flush_quiz_results())
+    yield
+    flusher.cancel()
+    try:
+        await flusher
+    except asyncio.CancelledError:
+        pass
+    while not _quiz_queue.empty():
+        batch: List[Tuple[int, int, int]] = []
+        _drain_quiz_queue(batch)
+        try:
+            _write_quiz_results(batch)
+        except Exception:
+            logger.exception("Failed to write %d quiz results", len(batch))
+
+
+# JSON endpoints are serialized with orjson rather than the standard library
+# json module.
+app = FastAPI(title="ReadyBuddy", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # The template and static directories are defined near the top of this file.
 # Mount the static directory (for CSS, images, etc.). You can place additional
 # assets in readybuddy_code/static and they will be served automatically. For
 # styling we rely primarily on Bootstrap via CDN.
-app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
-
-templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
+#
+# Static assets are served with a one‑year, immutable Cache-Control header so
+# browsers and CDNs stop re‑requesting them. When an asset changes, give it a
+# new URL (rename it, or bump the ?v= query string as the templates do for
+# style.css). In production, /static is better served straight from disk by a
+# reverse proxy; see the README.
+STATIC_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that adds a long‑lived Cache-Control header to every file."""
+
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = STATIC_CACHE_CONTROL
+        return response
+
+
+app.mount("/static", CachedStaticFiles(directory=STATIC_DIR), name="static")
+
+# Build the Jinja2 environment explicitly and render templates straight into
+# HTMLResponse objects, skipping Starlette's TemplateResponse wrapper.
+# Templates only change on deploy, so auto_reload is turned off (no stat() of
+# the template file on every render), the template cache is unbounded, and
+# compiled bytecode is kept on disk so a restarted worker skips re‑parsing.
+# Hosts with a read‑only filesystem simply go without the bytecode cache.
+JINJA_CACHE_DIR = BASE_DIR / ".jinja_cache"
+try:
+    JINJA_CACHE_DIR.mkdir(exist_ok=True)
+    bytecode_cache: Optional[FileSystemBytecodeCache] = FileSystemBytecodeCache(str(JINJA_CACHE_DIR))
+except OSError:
+    bytecode_cache = None
+
+jinja_env = Environment(
+    loader=FileSystemLoader(TEMPLATE_DIR),
+    autoescape=True,
+    auto_reload=False,
+    cache_size=-1,
+    bytecode_cache=bytecode_cache,
+)
+
+# Every template used by the routes below, loaded (and so compiled) once when
+# the module is imported rather than by the first visitor to each page.
+TPL_ONBOARDING = jinja_env.get_template("onboarding.html")
+TPL_MODULES = jinja_env.get_template("modules.html")
+TPL_MODULE_DETAIL = jinja_env.get_template("module_detail.html")
+TPL_QUIZ_RESULT = jinja_env.get_template("quiz_result.html")
+TPL_CHECKLIST = jinja_env.get_template("checklist.html")
+TPL_RESOURCES = jinja_env.get_template("resources.html")
+TPL_RESOURCE_CARD = jinja_env.get_template("resource_card.html")
 
 # ------------------------------ Data Models ------------------------------
+@dataclass(slots=True, frozen=True)
 class Module:
     """
     Represents a micro‑learning module with a quiz. Each module includes a
@@ -117,43 +338,39 @@ class Module:
     video is available.
     """
 
-    def __init__(
-        self,
-        id: int,
-        title: str,
-        description: str,
-        content: str,
-        question_text: str,
-        options: List[str],
-        answer: str,
-        image: Optional[str] = None,
-        video_link: Optional[str] = None,
-    ) -> None:
-        self.id = id
-        self.title = title
-        self.description = description
-        self.content = content
-        self.question = {
+    id: int
+    title: str
+    description: str
+    content: str
+    question_text: InitVar[str]
+    options: InitVar[List[str]]
+    answer: InitVar[str]
+    image: Optional[str] = None
+    video_link: Optional[str] = None
+    # Built from question_text/options/answer; templates read question.text,
+    # question.options and question.answer.
+    question: Dict[str, object] = field(init=False, compare=False)
+
+    def __post_init__(self, question_text: str, options: List[str], answer: str) -> None:
+        object.__setattr__(self, "question", {
             "text": question_text,
             "options": options,
             "answer": answer,
-        }
-        self.image = image
-        self.video_link = video_link
+        })
 
 
+@dataclass(slots=True, frozen=True)
 class ChecklistItem:
     """Represents a single emergency kit checklist item."""
 
-    def __init__(self, id: int, name: str, affiliate_url: str):
-        self.id = id
-        self.name = name
-        self.affiliate_url = affiliate_url
+    id: int
+    name: str
+    affiliate_url: str
 
 
 # Predefined modules and checklist items. In a real application these
 # could be stored in a database or pulled from an external API.
-modules: List[Module] = [
+modules: Tuple[Module, ...] = (
     # Core preparedness topics
     Module(
         id=1,
@@ -276,22 +493,27 @@ modules: List[Module] = [
         image="rural.png",
         video_link="https://www.ready.gov/wilderness"
     ),
-]
+)
 
-checklist_items: List[ChecklistItem] = [
+# Index modules by ID so route handlers can look one up without scanning the list.
+MODULES_BY_ID: Dict[int, Module] = {m.id: m for m in modules}
+# Correct quiz answer for each module ID, used when scoring submissions.
+MODULE_ANSWERS: Dict[int, str] = {m.id: m.question["answer"] for m in modules}
+
+checklist_items: Tuple[ChecklistItem, ...] = (
     ChecklistItem(1, "Water (one gallon per person per day)", "https://www.amazon.com/dp/B0B5YYR5J9"),
     ChecklistItem(2, "Non‑perishable food for three days", "https://www.amazon.com/dp/B084QVTVGN"),
     ChecklistItem(3, "Battery‑powered or hand‑crank radio", "https://www.amazon.com/dp/B07PVX7LH8"),
     ChecklistItem(4, "Flashlight & extra batteries", "https://www.amazon.com/dp/B004US6R7G"),
     ChecklistItem(5, "First aid kit", "https://www.amazon.com/dp/B01FSTYHXW"),
     ChecklistItem(6, "Whistle to signal for help", "https://www.amazon.com/dp/B000X25YTA"),
-]
+)
 
 # ------------------------------ Resources ------------------------------
 # Links to volunteer organizations and programs that support community
 # preparedness. These descriptions are drawn from official sources so
 # users understand why each program is important and how to get involved.
-resources: List[Dict[str, str]] = [
+resources: Tuple[Dict[str, str], ...] = (
     {
         "name": "SERV‑OR",
         "url": "https://www.serv-or.org",
@@ -326,52 +548,92 @@ resources: List[Dict[str, str]] = [
             "that helps emergency managers track and credential volunteers and helps volunteers connect to opportunities in their communities"
         ),
     },
-]
+)
+
+
+# --------------------------- Pre-rendered Pages ---------------------------
+# The onboarding form, module list, module detail, checklist and resources
+# pages depend only on the constant data above, never on the request, so each
+# is rendered once at import and the handlers serve the resulting bytes
+# without touching Jinja.
+ONBOARDING_HTML = TPL_ONBOARDING.render().encode()
+MODULES_HTML = TPL_MODULES.render(modules=modules).encode()
+MODULE_DETAIL_HTML: Dict[int, bytes] = {
+    m.id: TPL_MODULE_DETAIL.render(module=m).encode() for m in modules
+}
+CHECKLIST_HTML = TPL_CHECKLIST.render(items=checklist_items).encode()
+# Each resource card is rendered on its own from resource_card.html, and the
+# resources page only stitches the finished fragments together.
+RESOURCE_HTML: Tuple[str, ...] = tuple(TPL_RESOURCE_CARD.render(r=r) for r in resources)
+RESOURCES_HTML = TPL_RESOURCES.render(resource_html=RESOURCE_HTML).encode()
+
+# Strong ETags for the pre‑rendered pages, hashed once from their bytes. A
+# returning visitor whose If-None-Match matches gets an empty 304 instead of
+# the page. Browsers may reuse a page for PAGE_MAX_AGE seconds before
+# revalidating.
+PAGE_MAX_AGE = 300
+ETAGS: Dict[str, str] = {
+    name: '"' + hashlib.blake2b(html).hexdigest()[:16] + '"'
+    for name, html in (
+        ("modules", MODULES_HTML),
+        ("checklist", CHECKLIST_HTML),
+        ("resources", RESOURCES_HTML),
+    )
+}
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Return True if an If-None-Match header value matches `etag`."""
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+def _page_response(request: Request, name: str, content: bytes) -> Response:
+    """
+    Serve a pre‑rendered page with its ETag, or a 304 Not Modified if the
+    client already has the current version.
+    """
+    etag = ETAGS[name]
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={PAGE_MAX_AGE}"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(content=content, headers=headers)
 
 
 # ------------------------------- Routes -------------------------------
 @app.get("/")
-async def home(request: Request):
+async def home():
     """
     Display the onboarding form. In this simplified implementation we
     don’t persist onboarding data, so the form is always shown on the
     homepage. Once submitted, users are redirected to the modules page.
     """
-    return templates.TemplateResponse("onboarding.html", {"request": request})
+    return HTMLResponse(content=ONBOARDING_HTML)
 
 
-@app.get("/onboarding")
-async def submit_onboarding(request: Request):
+@app.post("/onboarding")
+async def submit_onboarding(
+    family_size: int = Form(..., gt=0),
+    location: str = Form(..., min_length=1),
+    skill_level: str = Form(..., min_length=1),
+):
     """
-    Handle onboarding form submission. We expect the form fields to be
-    delivered via the query string (family_size, location, skill_level).
-    A new record is inserted into the `user_profiles` table and the
+    Handle onboarding form submission. The form is posted with the fields
+    family_size, location and skill_level; FastAPI validates them (a
+    positive household size and non‑empty strings) before this handler
+    runs. A new record is inserted into the `user_profiles` table and the
     corresponding user ID is stored in a cookie. The user is then
-    redirected to the modules list. If any fields are missing or invalid,
-    we still redirect but do not persist data.
+    redirected to the modules list. Using POST means a browser refresh or
+    retry of the redirect target doesn't insert a duplicate profile.
     """
-    # Extract query parameters. Defaults are None if not provided.
-    family_size_raw = request.query_params.get("family_size")
-    location = request.query_params.get("location")
-    skill_level = request.query_params.get("skill_level")
     user_id = None
-    # Basic validation: ensure all parameters are present and
-    # family_size is an integer greater than zero.
     try:
-        if family_size_raw and location and skill_level:
-            family_size = int(family_size_raw)
-            if family_size > 0:
-                conn = sqlite3.connect(DB_PATH)
-                cur = conn.cursor()
-                cur.execute(
-                    "INSERT INTO user_profiles (family_size, location, skill_level) VALUES (?, ?, ?)",
-                    (family_size, location, skill_level),
-                )
-                user_id = cur.lastrowid
-                conn.commit()
-                conn.close()
+        user_id = await asyncio.get_running_loop().run_in_executor(
+            None, _write_profile, family_size, location, skill_level
+        )
     except Exception:
-        # In case of parsing or database errors, ignore and proceed
+        # In case of database errors, ignore and proceed
         pass
     # Redirect to modules page with a cookie if we obtained a user_id
     response = RedirectResponse(url="/modules", status_code=303)
@@ -390,72 +652,66 @@ async def submit_onboarding(request: Request):
 @app.get("/modules")
 async def modules_list(request: Request):
     """List all available micro‑learning modules."""
-    return templates.TemplateResponse("modules.html", {"request": request, "modules": modules})
+    return _page_response(request, "modules", MODULES_HTML)
 
 
 @app.get("/modules/{module_id}")
-async def module_detail(module_id: int, request: Request):
+async def module_detail(module_id: int):
     """Show the details for a single module, including its quiz."""
-    module = next((m for m in modules if m.id == module_id), None)
-    if not module:
+    html = MODULE_DETAIL_HTML.get(module_id)
+    if html is None:
         raise HTTPException(status_code=404, detail="Module not found")
-    return templates.TemplateResponse("module_detail.html", {
-        "request": request,
-        "module": module,
-    })
+    return HTMLResponse(content=html)
+
+
+def _user_id_cookie(user_id: Optional[str] = Cookie(None)) -> Optional[int]:
+    """
+    Parse the user_id cookie set by onboarding. A malformed value is treated
+    like a missing cookie, so the quiz still works but the result isn't
+    recorded.
+    """
+    if user_id is None:
+        return None
+    try:
+        return int(user_id)
+    except ValueError:
+        return None
 
 
 @app.get("/modules/{module_id}/quiz")
-async def submit_quiz(module_id: int, request: Request):
+async def submit_quiz(
+    module_id: int,
+    selected_option: Optional[str] = Query(None),
+    user_id: Optional[int] = Depends(_user_id_cookie),
+):
     """
     Evaluate the user's quiz answer and display the result. The form uses
     the GET method so the selected option is passed as a query
-    parameter. If no option is provided, the user is redirected back to
-    the module detail page. If a user_id cookie is present, we record
-    the quiz result (1 for correct, 0 for incorrect) in the database.
+    parameter. If no option is provided, or it isn't one of the module's
+    options, the user is redirected back to the module detail page. If a
+    user_id cookie is present, we record the quiz result (1 for correct,
+    0 for incorrect) in the database.
     """
-    module = next((m for m in modules if m.id == module_id), None)
+    module = MODULES_BY_ID.get(module_id)
     if not module:
         raise HTTPException(status_code=404, detail="Module not found")
-    selected_option: Optional[str] = request.query_params.get("selected_option")
-    if not selected_option:
+    if not selected_option or selected_option not in module.question["options"]:
         return RedirectResponse(url=f"/modules/{module_id}", status_code=303)
-    correct = selected_option == module.question["answer"]
+    correct = selected_option == MODULE_ANSWERS[module_id]
     # Persist result if we have a user_id cookie
-    user_id_str = request.cookies.get("user_id")
-    if user_id_str is not None:
-        try:
-            user_id = int(user_id_str)
-            score = 1 if correct else 0
-            conn = sqlite3.connect(DB_PATH)
-            cur = conn.cursor()
-            cur.execute(
-                "INSERT INTO quiz_results (user_id, module_id, score) VALUES (?, ?, ?)",
-                (user_id, module_id, score),
-            )
-            conn.commit()
-            conn.close()
-        except Exception:
-            # Ignore any errors related to database operations
-            pass
-    return templates.TemplateResponse(
-        "quiz_result.html",
-        {
-            "request": request,
-            "module": module,
-            "selected": selected_option,
-            "correct": correct,
-        },
-    )
+    if user_id is not None:
+        _quiz_queue.put_nowait((user_id, module_id, 1 if correct else 0))
+    return HTMLResponse(TPL_QUIZ_RESULT.render(
+        module=module,
+        selected=selected_option,
+        correct=correct,
+    ))
 
 
 @app.get("/checklist")
 async def view_checklist(request: Request):
     """Display the emergency kit checklist."""
-    return templates.TemplateResponse("checklist.html", {
-        "request": request,
-        "items": checklist_items,
-    })
+    return _page_response(request, "checklist", CHECKLIST_HTML)
 
 
 @app.get("/resources")
@@ -464,10 +720,29 @@ async def resources_page(request: Request):
     Display a page with descriptions and links to volunteer programs and
     organizations such as SERV‑OR, the Medical Reserve Corps, Community Emergency
     Response Teams (CERT) and OregonServes/ORVID. Each entry in the
-    `resources` list contains a name, description and URL. Adding a new
-    resource is as simple as appending to the list above.
+    `resources` tuple contains a name, description and URL. Adding a new
+    resource is as simple as adding an entry to the tuple above; the page is
+    pre‑rendered at import, so restart the server to pick up changes.
+    """
+    return _page_response(request, "resources", RESOURCES_HTML)
+
+
+# -------------------------------- API --------------------------------
+@app.get("/api/modules")
+async def api_modules():
     """
-    return templates.TemplateResponse("resources.html", {
-        "request": request,
-        "resources": resources,
-    })
\ No newline at end of file
+    Return every module as JSON. The dataclasses are handed to orjson
+    directly, which serializes them natively without first converting each
+    one to a dict through FastAPI's jsonable_encoder.
+    """
+    return ORJSONResponse(modules)
+
+
+if __name__ == "__main__":
+    # Run with one worker process per CPU. With uvloop and httptools
+    # installed (see requirements.txt), "auto" picks them over the pure
+    # Python asyncio loop and h11 parser; on Windows, where uvloop is
+    # unavailable, it falls back to asyncio.
+    import uvicorn
+
+    uvicorn.run("main:app", loop="auto", http="auto", workers=os.cpu_count())